@@ -1,12 +1,23 @@
 import ctypes
-from pathlib import Path
+import functools
 import platform
 import os
+import weakref
+from google.protobuf.internal import api_implementation
 from cookie_store_pb2 import Cookie, CookieJar
 
+# Every call across the FFI boundary serializes or parses a message, so refuse
+# to run on the much slower pure-Python protobuf runtime
+if api_implementation.Type() not in ("cpp", "upb"):
+    raise RuntimeError(
+        f"Unsupported protobuf implementation: {api_implementation.Type()} "
+        "(install protobuf with the C++ or upb backend)"
+    )
+
 # build library path
+@functools.lru_cache(maxsize=1)
 def get_library_path():
-    project_root = Path(__file__).parent.parent.parent
+    project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     system = platform.system()
     machine = platform.machine()
 
@@ -32,7 +43,7 @@ def get_library_path():
     build_type = os.getenv("BUILD_TYPE", "release").lower()
     lib_suffix = "debugShared" if build_type == "debug" else "releaseShared"
 
-    base_lib_dir = project_root / "build" / "bin" / kn_target / lib_suffix
+    base_lib_dir = os.path.join(project_root, "build", "bin", kn_target, lib_suffix)
 
     if system == "Windows":
         lib_name = "kcookie_store.dll"
@@ -41,197 +52,357 @@ def get_library_path():
     else:
         lib_name = "libkcookie_store.so"
 
-    lib_path = base_lib_dir / lib_name
-    if not lib_path.exists():
-        raise FileNotFoundError(f"Library not found at: {lib_path}")
-
-    return str(lib_path)
+    # No existence check: ctypes.CDLL reports a missing library itself
+    return os.path.join(base_lib_dir, lib_name)
 
 # load library
+# CDLL (unlike PyDLL) releases the GIL for the duration of every native call,
+# so other Python threads keep running while the store serializes cookies.
+# The library never calls back into the Python C API, so PyDLL is never needed.
+# This only helps threads doing other work: a single CookieStore reuses its
+# scratch out-parameters, so it must not be called concurrently.
 try:
     lib_path = get_library_path()
     lib = ctypes.CDLL(lib_path)
 except Exception as e:
     raise RuntimeError(f"Failed to load cookie manager library: {e}")
 
+# Register function prototypes once, shared by every CookieStore instance
+lib.cookie_store_new.restype = ctypes.c_void_p
+lib.cookie_store_new.argtypes = []
+
+lib.cookie_store_free.restype = None
+lib.cookie_store_free.argtypes = [ctypes.c_void_p]
+
+lib.cookie_store_set.restype = ctypes.c_int
+# Serialized payloads (here and in cookie_store_set_many) are passed as-is:
+# the native side copies them into its own ByteArray before decoding, so no
+# ctypes-owned or mutable buffer is needed on the Python side
+lib.cookie_store_set.argtypes = [
+    ctypes.c_void_p,
+    ctypes.c_char_p,
+    ctypes.c_int,
+    ctypes.POINTER(ctypes.c_void_p)
+]
+
+lib.cookie_store_set_flat.restype = ctypes.c_int
+lib.cookie_store_set_flat.argtypes = [
+    ctypes.c_void_p,
+    ctypes.c_char_p,
+    ctypes.c_char_p,
+    ctypes.c_char_p,
+    ctypes.c_char_p,
+    ctypes.c_int,
+    ctypes.c_int64,
+    ctypes.POINTER(ctypes.c_void_p)
+]
+
+lib.cookie_store_set_many.restype = ctypes.c_int
+lib.cookie_store_set_many.argtypes = [
+    ctypes.c_void_p,
+    ctypes.c_char_p,
+    ctypes.c_int,
+    ctypes.POINTER(ctypes.c_void_p)
+]
+
+lib.cookie_store_get_by_domain.restype = ctypes.c_int
+lib.cookie_store_get_by_domain.argtypes = [
+    ctypes.c_void_p,
+    ctypes.c_char_p,
+    ctypes.POINTER(ctypes.POINTER(ctypes.c_ubyte)),
+    ctypes.POINTER(ctypes.c_int),
+    ctypes.POINTER(ctypes.c_void_p)
+]
+
+lib.cookie_store_remove.restype = ctypes.c_int
+lib.cookie_store_remove.argtypes = [
+    ctypes.c_void_p,
+    ctypes.c_char_p,
+    ctypes.c_char_p,
+    ctypes.POINTER(ctypes.c_void_p)
+]
+
+lib.cookie_store_get_all.restype = ctypes.c_int
+lib.cookie_store_get_all.argtypes = [
+    ctypes.c_void_p,
+    ctypes.POINTER(ctypes.POINTER(ctypes.c_ubyte)),
+    ctypes.POINTER(ctypes.c_int),
+    ctypes.POINTER(ctypes.c_void_p)
+]
+
+lib.cookie_store_clear_all.restype = ctypes.c_int
+lib.cookie_store_clear_all.argtypes = [
+    ctypes.c_void_p,
+    ctypes.POINTER(ctypes.c_void_p)
+]
+
+lib.free_knative_pointer.restype = None
+lib.free_knative_pointer.argtypes = [ctypes.c_void_p]
+
 # Define error codes
 COOKIE_SUCCESS = 0
 COOKIE_NOT_FOUND = 1
 COOKIE_ALLOCATION_FAILED = 2
 COOKIE_EXCEPTION = -1
 
+# Define cookie flags
+COOKIE_FLAG_SECURE = 1
+COOKIE_FLAG_HTTP_ONLY = 2
+
+# Module-level aliases for ctypes helpers used on the per-call paths
+_byref = ctypes.byref
+_memset = ctypes.memset
+_string_at = ctypes.string_at
+_POINTER_SIZE = ctypes.sizeof(ctypes.c_void_p)
+
+def _reset_pointer(ptr):
+    """Reset a reusable ctypes pointer out-parameter back to NULL"""
+    _memset(_byref(ptr), 0, _POINTER_SIZE)
+
+@functools.lru_cache(maxsize=256)
+def _encode(text):
+    """Encode a low-cardinality string (domain, path) for C, memoizing the result.
+
+    Names and values are mostly unique, so they are encoded directly rather
+    than churning this cache.
+    """
+    return text.encode('utf-8')
+
+def _parse_jar(data):
+    # Parse into a fresh message each time: with upb, re-parsing into a reused
+    # message keeps growing its arena for as long as the message lives
+    return list(CookieJar.FromString(data).cookies)
+
 class CookieStore:
+    """Python handle to a native CookieStore.
+
+    Not thread-safe: every call reuses this instance's scratch out-parameters,
+    so concurrent calls on one store can clobber each other's native buffers
+    (leaking one, double-freeing another). Use one store per thread, or
+    serialize access with a lock.
+    """
+
+    __slots__ = (
+        "_store", "_finalizer", "_err_msg", "_out_len", "_out_data",
+        "_err_msg_ref", "_out_len_ref", "_out_data_ref", "__weakref__",
+    )
+
+    # Bound native functions, resolved once instead of via `lib` on every call
+    _new = lib.cookie_store_new
+    _free = lib.cookie_store_free
+    _set = lib.cookie_store_set
+    _set_flat = lib.cookie_store_set_flat
+    _set_many = lib.cookie_store_set_many
+    _get_by_domain = lib.cookie_store_get_by_domain
+    _remove = lib.cookie_store_remove
+    _get_all = lib.cookie_store_get_all
+    _clear_all = lib.cookie_store_clear_all
+    _free_pointer = lib.free_knative_pointer
+
     def __init__(self):
-        lib.cookie_store_new.restype = ctypes.c_void_p
-        lib.cookie_store_new.argtypes = []
-
-        lib.cookie_store_free.restype = None
-        lib.cookie_store_free.argtypes = [ctypes.c_void_p]
-
-        lib.cookie_store_set.restype = ctypes.c_int
-        lib.cookie_store_set.argtypes = [
-            ctypes.c_void_p,
-            ctypes.POINTER(ctypes.c_ubyte),
-            ctypes.c_int,
-            ctypes.POINTER(ctypes.c_char_p)
-        ]
-
-        lib.cookie_store_get_by_domain.restype = ctypes.c_int
-        lib.cookie_store_get_by_domain.argtypes = [
-            ctypes.c_void_p,
-            ctypes.c_char_p,
-            ctypes.POINTER(ctypes.POINTER(ctypes.c_ubyte)),
-            ctypes.POINTER(ctypes.c_int),
-            ctypes.POINTER(ctypes.c_char_p)
-        ]
-
-        lib.cookie_store_remove.restype = ctypes.c_int
-        lib.cookie_store_remove.argtypes = [
-            ctypes.c_void_p,
-            ctypes.c_char_p,
-            ctypes.c_char_p,
-            ctypes.POINTER(ctypes.c_char_p)
-        ]
-
-        lib.cookie_store_get_all.restype = ctypes.c_int
-        lib.cookie_store_get_all.argtypes = [
-            ctypes.c_void_p,
-            ctypes.POINTER(ctypes.POINTER(ctypes.c_ubyte)),
-            ctypes.POINTER(ctypes.c_int),
-            ctypes.POINTER(ctypes.c_char_p)
-        ]
-
-        lib.cookie_store_clear_all.restype = ctypes.c_int
-        lib.cookie_store_clear_all.argtypes = [
-            ctypes.c_void_p,
-            ctypes.POINTER(ctypes.c_char_p)
-        ]
-
-        lib.free_knative_pointer.restype = None
-        lib.free_knative_pointer.argtypes = [ctypes.c_void_p]
-
-        self._store = lib.cookie_store_new()
+        self._store = self._new()
         if not self._store:
             raise RuntimeError("Failed to create cookie store")
+        # Frees the native store on close() or garbage collection, whichever comes first
+        self._finalizer = weakref.finalize(self, self._free, self._store)
+
+        # Scratch out-parameters reused across calls instead of rebuilt each time.
+        # Sharing them is what makes a CookieStore unsafe to use from several threads.
+        # Error messages are read with string_at only on failure
+        self._err_msg = ctypes.c_void_p()
+        self._out_len = ctypes.c_int()
+        self._out_data = ctypes.POINTER(ctypes.c_ubyte)()
+
+        # Pre-built references to the scratch out-parameters; they already match
+        # the registered argtypes, so ctypes passes them through unconverted
+        self._err_msg_ref = _byref(self._err_msg)
+        self._out_len_ref = _byref(self._out_len)
+        self._out_data_ref = _byref(self._out_data)
+
+    def _handle(self):
+        """Return the native store pointer, refusing to hand NULL to Kotlin"""
+        store = self._store
+        if store is None:
+            raise RuntimeError("CookieStore is closed")
+        return store
+
+    def close(self):
+        self._finalizer()
+        self._store = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def set(self, cookie):
+        fields = (cookie.name, cookie.value, cookie.domain, cookie.path)
+        if any('\x00' in field for field in fields):
+            # C strings stop at the first NUL, so send the serialized message
+            # instead to keep such fields intact
+            return self._set_serialized(cookie)
+        # A Cookie is a small fixed record, so send its fields directly
+        # rather than paying for a protobuf encode/decode round-trip
+        return self._set_fields(*fields, cookie.secure, cookie.httpOnly, cookie.expirationTime)
+
+    def set_flat(self, name, value, domain, path, secure=False, http_only=False, expiration_time=0):
+        if any('\x00' in field for field in (name, value, domain, path)):
+            raise ValueError("Cookie fields passed to set_flat must not contain NUL characters")
+        return self._set_fields(name, value, domain, path, secure, http_only, expiration_time)
+
+    def _set_fields(self, name, value, domain, path, secure, http_only, expiration_time):
+        flags = (COOKIE_FLAG_SECURE if secure else 0) | (COOKIE_FLAG_HTTP_ONLY if http_only else 0)
+        err_msg = self._err_msg
+        err_msg.value = None
 
-    def __del__(self):
         try:
-            if hasattr(self, '_store') and self._store:
-                lib.cookie_store_free(self._store)
-        except Exception:
-            pass
+            result = self._set_flat(
+                self._handle(),
+                name.encode('utf-8'),
+                value.encode('utf-8'),
+                _encode(domain),
+                _encode(path),
+                flags,
+                expiration_time,
+                self._err_msg_ref
+            )
+            if result != COOKIE_SUCCESS:
+                error = _string_at(err_msg).decode('utf-8') if err_msg.value else "Unknown error"
+                raise RuntimeError(f"Failed to set cookie: {error}")
+            return True
         finally:
-            self._store = None
+            if err_msg.value:
+                self._free_pointer(err_msg)
 
-    def set(self, cookie):
+    def _set_serialized(self, cookie):
         cookie_data = cookie.SerializeToString()
-        data_ptr = (ctypes.c_ubyte * len(cookie_data)).from_buffer_copy(cookie_data)
-        err_msg = ctypes.c_char_p()
+        err_msg = self._err_msg
+        err_msg.value = None
 
         try:
-            result = lib.cookie_store_set(
-                self._store,
-                data_ptr,
+            result = self._set(
+                self._handle(),
+                cookie_data,
                 len(cookie_data),
-                ctypes.byref(err_msg)
+                self._err_msg_ref
             )
             if result != COOKIE_SUCCESS:
-                error = err_msg.value.decode('utf-8') if err_msg.value else "Unknown error"
+                error = _string_at(err_msg).decode('utf-8') if err_msg.value else "Unknown error"
                 raise RuntimeError(f"Failed to set cookie: {error}")
             return True
         finally:
             if err_msg.value:
-                lib.free_knative_pointer(err_msg)
+                self._free_pointer(err_msg)
 
-    def get_by_domain(self, domain):
-        out_data = ctypes.POINTER(ctypes.c_ubyte)()
-        out_len = ctypes.c_int()
-        err_msg = ctypes.c_char_p()
+    def set_many(self, cookies):
+        jar = CookieJar()
+        jar.cookies.extend(cookies)
+        jar_data = jar.SerializeToString()
+        err_msg = self._err_msg
+        err_msg.value = None
 
         try:
-            result = lib.cookie_store_get_by_domain(
-                self._store,
-                domain.encode('utf-8'),
-                ctypes.byref(out_data),
-                ctypes.byref(out_len),
-                ctypes.byref(err_msg)
+            result = self._set_many(
+                self._handle(),
+                jar_data,
+                len(jar_data),
+                self._err_msg_ref
+            )
+            if result != COOKIE_SUCCESS:
+                error = _string_at(err_msg).decode('utf-8') if err_msg.value else "Unknown error"
+                raise RuntimeError(f"Failed to set cookies: {error}")
+            return True
+        finally:
+            if err_msg.value:
+                self._free_pointer(err_msg)
+
+    def _read_buffer(self, func, args, action,
+                     _reset_pointer=_reset_pointer, _string_at=_string_at):
+        """Call a native getter and return a copy of the buffer it produced.
+
+        Returns None when the store reports COOKIE_NOT_FOUND. The native buffer
+        is copied into bytes and freed before returning.
+        """
+        out_data = self._out_data
+        out_len = self._out_len
+        err_msg = self._err_msg
+        # out_len is only read after COOKIE_SUCCESS, which always writes it,
+        # so only the pointers checked in `finally` need clearing
+        _reset_pointer(out_data)
+        err_msg.value = None
+
+        try:
+            result = func(
+                self._handle(),
+                *args,
+                self._out_data_ref,
+                self._out_len_ref,
+                self._err_msg_ref
             )
 
             if result == COOKIE_NOT_FOUND:
-                return []
+                return None
             elif result != COOKIE_SUCCESS:
-                error = err_msg.value.decode('utf-8') if err_msg.value else "Unknown error"
-                raise RuntimeError(f"Failed to get cookies by domain: {error}")
+                error = _string_at(err_msg).decode('utf-8') if err_msg.value else "Unknown error"
+                raise RuntimeError(f"Failed to {action}: {error}")
 
-            data = bytes(ctypes.cast(out_data, ctypes.POINTER(ctypes.c_ubyte * out_len.value)).contents)
-            cookie_jar = CookieJar()
-            cookie_jar.ParseFromString(data)
-            return list(cookie_jar.cookies)
+            return _string_at(out_data, out_len.value)
         finally:
             if out_data:
-                lib.free_knative_pointer(out_data)
+                self._free_pointer(out_data)
+                _reset_pointer(out_data)
             if err_msg.value:
-                lib.free_knative_pointer(err_msg)
+                self._free_pointer(err_msg)
+
+    def get_by_domain_raw(self, domain):
+        data = self._read_buffer(self._get_by_domain, (_encode(domain),), "get cookies by domain")
+        return data if data is not None else b""
+
+    def get_by_domain(self, domain):
+        data = self._read_buffer(self._get_by_domain, (_encode(domain),), "get cookies by domain")
+        return _parse_jar(data) if data is not None else []
 
     def remove(self, name, domain):
-        err_msg = ctypes.c_char_p()
+        err_msg = self._err_msg
+        err_msg.value = None
 
         try:
-            result = lib.cookie_store_remove(
-                self._store,
+            result = self._remove(
+                self._handle(),
                 name.encode('utf-8'),
-                domain.encode('utf-8'),
-                ctypes.byref(err_msg)
+                _encode(domain),
+                self._err_msg_ref
             )
             if result != COOKIE_SUCCESS:
-                error = err_msg.value.decode('utf-8') if err_msg.value else "Unknown error"
+                error = _string_at(err_msg).decode('utf-8') if err_msg.value else "Unknown error"
                 raise RuntimeError(f"Failed to remove cookie: {error}")
             return True
         finally:
             if err_msg.value:
-                lib.free_knative_pointer(err_msg)
-
-    def get_all(self):
-        out_data = ctypes.POINTER(ctypes.c_ubyte)()
-        out_len = ctypes.c_int()
-        err_msg = ctypes.c_char_p()
+                self._free_pointer(err_msg)
 
-        try:
-            result = lib.cookie_store_get_all(
-                self._store,
-                ctypes.byref(out_data),
-                ctypes.byref(out_len),
-                ctypes.byref(err_msg)
-            )
-
-            if result == COOKIE_NOT_FOUND:
-                return []
-            elif result != COOKIE_SUCCESS:
-                error = err_msg.value.decode('utf-8') if err_msg.value else "Unknown error"
-                raise RuntimeError(f"Failed to get all cookies: {error}")
+    def get_all_raw(self):
+        data = self._read_buffer(self._get_all, (), "get all cookies")
+        return data if data is not None else b""
 
-            data = bytes(ctypes.cast(out_data, ctypes.POINTER(ctypes.c_ubyte * out_len.value)).contents)
-            cookie_jar = CookieJar()
-            cookie_jar.ParseFromString(data)
-            return list(cookie_jar.cookies)
-        finally:
-            if out_data:
-                lib.free_knative_pointer(out_data)
-            if err_msg.value:
-                lib.free_knative_pointer(err_msg)
+    def get_all(self):
+        data = self._read_buffer(self._get_all, (), "get all cookies")
+        return _parse_jar(data) if data is not None else []
 
     def clear_all(self):
-        err_msg = ctypes.c_char_p()
+        err_msg = self._err_msg
+        err_msg.value = None
 
         try:
-            result = lib.cookie_store_clear_all(
-                self._store,
-                ctypes.byref(err_msg)
+            result = self._clear_all(
+                self._handle(),
+                self._err_msg_ref
             )
             if result != COOKIE_SUCCESS:
-                error = err_msg.value.decode('utf-8') if err_msg.value else "Unknown error"
+                error = _string_at(err_msg).decode('utf-8') if err_msg.value else "Unknown error"
                 raise RuntimeError(f"Failed to clear all cookies: {error}")
             return True
         finally:
             if err_msg.value:
-                lib.free_knative_pointer(err_msg)
+                self._free_pointer(err_msg)
@@ -7,10 +7,12 @@ from cookie_store_pb2 import Cookie, CookieJar
 # Fixed domains
 DOMAINS = ["example.com", "test.com", "demo.org"]
 
+# Characters used for random cookie names and values
+CHARS = string.ascii_letters + string.digits
+
 def random_string(length):
     """Generate a random string of given length"""
-    chars = string.ascii_letters + string.digits
-    return ''.join(random.choice(chars) for _ in range(length))
+    return ''.join(random.choices(CHARS, k=length))
 
 def print_menu():
     """Print the test menu options"""
@@ -86,6 +88,15 @@ def test_clear_all(store):
     except Exception as e:
         print(f"Clear all cookies failed: {e}")
 
+# Menu choice -> test function
+ACTIONS = {
+    1: test_add_cookie,
+    2: test_get_by_domain,
+    3: test_remove_cookie,
+    4: test_get_all,
+    5: test_clear_all,
+}
+
 def main():
     """Main test program"""
     random.seed(time.time())
@@ -96,30 +107,24 @@ def main():
         print(f"Failed to create CookieStore: {e}")
         return
 
-    while True:
-        print_menu()
-        choice = input("Enter choice: ").strip()
+    with store:
+        while True:
+            print_menu()
+            choice = input("Enter choice: ").strip()
+
+            if not choice.isdecimal():
+                print("Invalid input. Please enter a menu number.")
+                continue
 
-        try:
             choice = int(choice)
-        except ValueError:
-            print("Invalid input. Please enter a number.")
-            continue
-
-        if choice == 0:
-            break
-        elif choice == 1:
-            test_add_cookie(store)
-        elif choice == 2:
-            test_get_by_domain(store)
-        elif choice == 3:
-            test_remove_cookie(store)
-        elif choice == 4:
-            test_get_all(store)
-        elif choice == 5:
-            test_clear_all(store)
-        else:
-            print("Invalid choice. Please try again.")
+            if choice == 0:
+                break
+
+            action = ACTIONS.get(choice)
+            if action:
+                action(store)
+            else:
+                print("Invalid choice. Please try again.")
 
     print("Exiting program.")
 
@@ -6,6 +6,7 @@ extern "C" {
 #endif
 
 #include <stddef.h> // for size_t
+#include <stdint.h> // for int64_t
 
 // ============================================================
 // Error Codes
@@ -15,6 +16,12 @@ extern "C" {
 #define COOKIE_ALLOCATION_FAILED    2   // Memory allocation failed
 #define COOKIE_EXCEPTION           -1   // Unexpected exception
 
+// ============================================================
+// Cookie Flags (for cookie_store_set_flat)
+// ============================================================
+#define COOKIE_FLAG_SECURE          1   // Cookie is secure
+#define COOKIE_FLAG_HTTP_ONLY       2   // Cookie is HTTP-only
+
 // ============================================================
 // Type Definitions
 // ============================================================
@@ -65,6 +72,50 @@ int cookie_store_set(
     char** errMsg
 );
 
+/**
+ * Set (add or update) a cookie from its individual fields, without protobuf.
+ *
+ * @param store          Pointer to CookieStore.
+ * @param name           Cookie name (null-terminated).
+ * @param value          Cookie value (null-terminated).
+ * @param domain         Domain name (null-terminated).
+ * @param path           Cookie path (null-terminated).
+ * @param flags          Bitwise OR of COOKIE_FLAG_SECURE and COOKIE_FLAG_HTTP_ONLY.
+ * @param expirationTime Expiration time.
+ * @param errMsg         Output parameter for error message string (set only on error).
+ *                       Caller must free with free_knative_pointer().
+ *
+ * @return COOKIE_SUCCESS or COOKIE_EXCEPTION.
+ */
+int cookie_store_set_flat(
+    cookie_store_t store,
+    const char* name,
+    const char* value,
+    const char* domain,
+    const char* path,
+    int flags,
+    int64_t expirationTime,
+    char** errMsg
+);
+
+/**
+ * Set (add or update) multiple cookies in the store with a single call.
+ *
+ * @param store   Pointer to CookieStore.
+ * @param jarData Pointer to serialized CookieJar bytes.
+ * @param jarLen  Length of the serialized data.
+ * @param errMsg  Output parameter for error message string (set only on error).
+ *                Caller must free with free_knative_pointer().
+ *
+ * @return COOKIE_SUCCESS or COOKIE_EXCEPTION.
+ */
+int cookie_store_set_many(
+    cookie_store_t store,
+    const unsigned char* jarData,
+    int jarLen,
+    char** errMsg
+);
+
 /**
  * Get cookies by domain.
  *
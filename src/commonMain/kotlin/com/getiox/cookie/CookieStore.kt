@@ -10,6 +10,11 @@ internal class CookieStore {
         store[key(cookie.name, cookie.domain)] = cookie
     }
 
+    /** Add or update multiple cookies */
+    fun setAll(cookies: List<Cookie>) {
+        cookies.forEach { store[key(it.name, it.domain)] = it }
+    }
+
     /** Remove a specific cookie */
     fun remove(cookie: Cookie) {
         store.remove(key(cookie.name, cookie.domain))
@@ -0,0 +1,2 @@
+internal const val COOKIE_FLAG_SECURE = 1
+internal const val COOKIE_FLAG_HTTP_ONLY = 2
\ No newline at end of file
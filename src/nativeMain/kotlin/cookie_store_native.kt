@@ -1,6 +1,7 @@
 @file:OptIn(ExperimentalNativeApi::class)
 
 import com.getiox.cookie.Cookie
+import com.getiox.cookie.CookieJar
 import com.getiox.cookie.CookieStore
 import kotlinx.cinterop.*
 import kotlin.experimental.ExperimentalNativeApi
@@ -93,6 +94,94 @@ fun setCookie(
     }
 }
 
+/**
+ * Set (add or update) a cookie from its individual fields, without protobuf.
+ *
+ * @param ptr            Pointer to CookieStore.
+ * @param name           Cookie name (const char*).
+ * @param value          Cookie value (const char*).
+ * @param domain         Domain name (const char*).
+ * @param path           Cookie path (const char*).
+ * @param flags          Bitwise OR of COOKIE_FLAG_SECURE and COOKIE_FLAG_HTTP_ONLY.
+ * @param expirationTime Expiration time.
+ * @param errMsg         Output char** for error message (set only on error).
+ *
+ * @return COOKIE_SUCCESS or COOKIE_EXCEPTION.
+ *
+ * Memory:
+ *   - If errMsg is set, caller must free with `free_knative_pointer`.
+ */
+@CName("cookie_store_set_flat")
+fun setCookieFlat(
+    ptr: COpaquePointer,
+    name: CPointer<ByteVar>,
+    value: CPointer<ByteVar>,
+    domain: CPointer<ByteVar>,
+    path: CPointer<ByteVar>,
+    flags: Int,
+    expirationTime: Long,
+    errMsg: CPointer<CPointerVar<ByteVar>>
+): Int {
+    return try {
+        val cookie = Cookie(
+            name = name.toKString(),
+            value = value.toKString(),
+            domain = domain.toKString(),
+            path = path.toKString(),
+            secure = flags and COOKIE_FLAG_SECURE != 0,
+            httpOnly = flags and COOKIE_FLAG_HTTP_ONLY != 0,
+            expirationTime = expirationTime,
+        )
+        println("[kotlin-cookie_store_set_flat] Received cookie: $cookie")
+
+        ptr.toCookieStore().set(cookie)
+        println("[kotlin-cookie_store_set_flat] Cookie stored successfully")
+        COOKIE_SUCCESS
+    } catch (e: Exception) {
+        val msg = "Exception in setCookieFlat: ${e.message}"
+        println("[kotlin-cookie_store_set_flat] $msg")
+        setError(errMsg, msg)
+        COOKIE_EXCEPTION
+    }
+}
+
+/**
+ * Set (add or update) multiple cookies in the store with a single call.
+ *
+ * @param ptr     Pointer to CookieStore.
+ * @param jarData Pointer to serialized CookieJar bytes.
+ * @param jarLen  Length of the serialized data.
+ * @param errMsg  Output char** for error message (set only on error).
+ *
+ * @return COOKIE_SUCCESS or COOKIE_EXCEPTION.
+ *
+ * Memory:
+ *   - If errMsg is set, caller must free with `free_knative_pointer`.
+ */
+@CName("cookie_store_set_many")
+fun setCookies(
+    ptr: COpaquePointer,
+    jarData: CPointer<UByteVar>,
+    jarLen: Int,
+    errMsg: CPointer<CPointerVar<ByteVar>>
+): Int {
+    println("[kotlin-cookie_store_set_many] Received cookie jar length=$jarLen bytes")
+    return try {
+        val dstData = jarData.toKByteArray(jarLen)
+        val jar = CookieJar.fromBytes(dstData)
+        println("[kotlin-cookie_store_set_many] Parsed ${jar.cookies.size} cookies")
+
+        ptr.toCookieStore().setAll(jar.cookies)
+        println("[kotlin-cookie_store_set_many] Cookies stored successfully")
+        COOKIE_SUCCESS
+    } catch (e: Exception) {
+        val msg = "Exception in setCookies: ${e.message}"
+        println("[kotlin-cookie_store_set_many] $msg")
+        setError(errMsg, msg)
+        COOKIE_EXCEPTION
+    }
+}
+
 /**
  * Get cookies by domain.
  *